@@ -1,7 +1,15 @@
-from typing import Optional, Any
+from threading import Lock
+from typing import Optional, Any, Dict
 
 from phi.utils.log import logger
 
+# Size of the urllib3 connection pool shared by all calls made through a service client
+AWS_MAX_POOL_CONNECTIONS: int = 50
+# Retries used by service clients unless retries are configured using env vars or the aws config file
+DEFAULT_RETRY_MODE: str = "adaptive"
+# Maximum attempts per call, including the first
+DEFAULT_MAX_ATTEMPTS: int = 10
+
 
 class AwsApiClient:
     def __init__(
@@ -15,6 +23,10 @@ class AwsApiClient:
 
         # aws boto3 session
         self._boto3_session: Optional[Any] = None
+        # boto3 clients shared by all resources using this AwsApiClient, keyed by service_name
+        self._service_clients: Dict[str, Any] = {}
+        # boto3 sessions are not thread safe, so clients are created under a lock
+        self._service_clients_lock: Lock = Lock()
         logger.debug("**-+-** AwsApiClient created")
 
     def create_boto3_session(self) -> Optional[Any]:
@@ -41,3 +53,51 @@ class AwsApiClient:
         if self._boto3_session is None:
             self._boto3_session = self.create_boto3_session()
         return self._boto3_session
+
+    def get_service_client(self, service_name: str) -> Any:
+        """Returns a boto3 client for service_name, creating it on first use.
+
+        The client is reused across resources so calls share its connection pool.
+        """
+        with self._service_clients_lock:
+            service_client = self._service_clients.get(service_name)
+            if service_client is None:
+                from botocore.config import Config
+                from phi.cli.settings import phi_cli_settings
+
+                boto3_session = self.boto3_session
+                if boto3_session is None:
+                    raise Exception("Could not create boto3.Session")
+
+                # Use the retries configured by the user, otherwise the phidata defaults
+                retries: Optional[Dict[str, Any]] = None
+                if not self.retries_configured(boto3_session):
+                    retries = {"mode": DEFAULT_RETRY_MODE, "total_max_attempts": DEFAULT_MAX_ATTEMPTS}
+
+                logger.debug(f"Creating boto3 client for {service_name}")
+                # botocore sets TCP_NODELAY on every socket, tcp_keepalive adds SO_KEEPALIVE
+                service_client = boto3_session.client(
+                    service_name=service_name,
+                    config=Config(
+                        max_pool_connections=AWS_MAX_POOL_CONNECTIONS,
+                        tcp_keepalive=True,
+                        retries=retries,
+                        user_agent_extra=f"phidata/{phi_cli_settings.app_version}",
+                    ),
+                )
+                self._service_clients[service_name] = service_client
+        return service_client
+
+    def retries_configured(self, boto3_session: Any) -> bool:
+        """Returns True if retries are configured using AWS_RETRY_MODE/AWS_MAX_ATTEMPTS or the aws config file"""
+        from os import getenv
+        from phi.constants import AWS_RETRY_MODE_ENV_VAR, AWS_MAX_ATTEMPTS_ENV_VAR
+
+        if getenv(AWS_RETRY_MODE_ENV_VAR) is not None or getenv(AWS_MAX_ATTEMPTS_ENV_VAR) is not None:
+            return True
+        try:
+            scoped_config = boto3_session._session.get_scoped_config()
+            return "retry_mode" in scoped_config or "max_attempts" in scoped_config
+        except Exception as e:
+            logger.debug(f"Could not read aws config: {e}")
+        return False
@@ -57,11 +57,8 @@ class AwsResource(ResourceBase):
         return self.aws_profile
 
     def get_service_client(self, aws_client: AwsApiClient):
-        from boto3 import session
-
         if self.service_client is None:
-            boto3_session: session = aws_client.boto3_session
-            self.service_client = boto3_session.client(service_name=self.service_name)
+            self.service_client = aws_client.get_service_client(service_name=self.service_name)
         return self.service_client
 
     def get_service_resource(self, aws_client: AwsApiClient):
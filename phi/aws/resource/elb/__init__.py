@@ -1,3 +1,3 @@
 from phi.aws.resource.elb.load_balancer import LoadBalancer
 from phi.aws.resource.elb.target_group import TargetGroup
-from phi.aws.resource.elb.listener import Listener
+from phi.aws.resource.elb.listener import Listener, delete_listeners_batch
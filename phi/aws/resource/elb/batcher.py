@@ -0,0 +1,58 @@
+from concurrent.futures import Future
+from threading import Lock
+from time import monotonic
+from typing import Any, Dict, List, Tuple
+
+from phi.utils.log import logger
+
+
+class DescribeListenersBatcher:
+    """Coalesces describe_listeners calls for the same load balancer.
+
+    describe_listeners(LoadBalancerArn=...) returns every listener on the load balancer, so
+    Listeners reading the same load balancer can share one response. The first caller for a
+    load balancer issues the request and concurrent callers wait on the same Future. The
+    response is then reused by later callers for `window` seconds.
+    """
+
+    def __init__(self, window: float = 0.3):
+        self.window: float = window
+        self._lock: Lock = Lock()
+        # load_balancer_arn -> (time the request was issued, Future for the list of listeners)
+        self._requests: Dict[str, Tuple[float, Future]] = {}
+
+    def submit(self, service_client: Any, load_balancer_arn: str) -> Future:
+        """Returns a Future for the list of listeners on the load balancer"""
+        with self._lock:
+            request = self._requests.get(load_balancer_arn)
+            if request is not None:
+                issued_at, future = request
+                if not future.done() or (monotonic() - issued_at) < self.window:
+                    return future
+            future = Future()
+            self._requests[load_balancer_arn] = (monotonic(), future)
+
+        try:
+            describe_response = service_client.describe_listeners(LoadBalancerArn=load_balancer_arn)
+            logger.debug(f"Describe Response: {describe_response}")
+            resource_list: List[Dict[str, Any]] = describe_response.get("Listeners", None) or []
+            future.set_result(resource_list)
+        except BaseException as e:
+            # Do not reuse failed requests, and resolve the Future so waiting callers do not block
+            with self._lock:
+                request = self._requests.get(load_balancer_arn)
+                if request is not None and request[1] is future:
+                    self._requests.pop(load_balancer_arn, None)
+            future.set_exception(e)
+            # Propagate KeyboardInterrupt, SystemExit, etc. to the caller that issued the request
+            if not isinstance(e, Exception):
+                raise
+        return future
+
+    def invalidate(self, load_balancer_arn: str) -> None:
+        """Drops the cached response for the load balancer, e.g. after one of its listeners changes"""
+        with self._lock:
+            self._requests.pop(load_balancer_arn, None)
+
+
+listeners_batcher = DescribeListenersBatcher()
@@ -1,3 +1,4 @@
+from concurrent.futures import Executor
 from typing import Optional, Any, Dict, List
 
 from phi.aws.api_client import AwsApiClient
@@ -5,7 +6,7 @@ from phi.aws.resource.base import AwsResource
 from phi.aws.resource.acm.certificate import AcmCertificate
 from phi.aws.resource.elb.load_balancer import LoadBalancer
 from phi.aws.resource.elb.target_group import TargetGroup
-from phi.cli.console import print_info
+from phi.aws.resource.elb.batcher import listeners_batcher
 from phi.utils.log import logger
 
 
@@ -32,35 +33,25 @@ class Listener(AwsResource):
     alpn_policy: Optional[List[str]] = None
     tags: Optional[List[Dict[str, str]]] = None
 
+    # -*- Cached Data
+    # True if active_resource was set by hydrate_all, so a missing Listener is not read again
+    _hydrated: bool = False
+
     def _create(self, aws_client: AwsApiClient) -> bool:
         """Creates the Listener
 
         Args:
             aws_client: The AwsApiClient for the current Listener
         """
-        print_info(f"Creating {self.get_resource_type()}: {self.get_resource_name()}")
+        logger.info("Creating %s: %s", self.get_resource_type(), self.get_resource_name())
 
         load_balancer_arn = self.get_load_balancer_arn(aws_client)
         if load_balancer_arn is None:
             logger.error("Load balancer ARN not available")
             return False
 
-        listener_port = self.get_listener_port()
-        listener_protocol = self.get_listener_protocol()
-        listener_certificates = self.get_listener_certificates(aws_client)
-
         # create a dict of args which are not null, otherwise aws type validation fails
-        not_null_args: Dict[str, Any] = {}
-        if listener_port is not None:
-            not_null_args["Port"] = listener_port
-        if listener_protocol is not None:
-            not_null_args["Protocol"] = listener_protocol
-        if listener_certificates is not None:
-            not_null_args["Certificates"] = listener_certificates
-        if self.ssl_policy is not None:
-            not_null_args["SslPolicy"] = self.ssl_policy
-        if self.alpn_policy is not None:
-            not_null_args["AlpnPolicy"] = self.alpn_policy
+        not_null_args: Dict[str, Any] = self.get_listener_args(aws_client)
 
         # listener tags container a name for the listener
         listener_tags = self.get_listener_tags()
@@ -87,50 +78,97 @@ class Listener(AwsResource):
                 **not_null_args,
             )
             logger.debug(f"Create Response: {create_response}")
-            resource_dict = create_response.get("Listeners", {})
+            resource_list = create_response.get("Listeners", None)
 
             # Validate resource creation
-            if resource_dict is not None:
-                self.active_resource = create_response
+            if resource_list:
+                listeners_batcher.invalidate(load_balancer_arn)
+                self.active_resource = resource_list[0]
                 return True
         except Exception as e:
             logger.error(f"{self.get_resource_type()} could not be created.")
             logger.error(e)
         return False
 
-    def _read(self, aws_client: AwsApiClient) -> Optional[Any]:
+    def post_create(self, aws_client: AwsApiClient) -> bool:
+        # Nothing was read or created if skip_read = True and the Listener was reported as existing
+        if self.skip_read:
+            return True
+        # create_listener returns the Listener, so only wait if it is not available yet
+        if self.active_resource is not None:
+            return True
+        # Nothing was created if neither target group nor default actions are provided
+        if self.default_actions is None and self.target_group is None:
+            return True
+
+        # Wait for Listener to be available
+        if self.wait_for_create:
+            logger.info("Waiting for %s to be available.", self.get_resource_type())
+            listener = self._wait_for_listener(aws_client)
+            if listener is None:
+                logger.error(f"{self.get_resource_type()} not available: {self.get_resource_name()}")
+        return True
+
+    def _wait_for_listener(self, aws_client: AwsApiClient) -> Optional[Any]:
+        """Polls describe_listeners until the Listener is available, as elbv2 has no waiter for listeners.
+
+        Polls up to waiter_max_attempts times, waiting waiter_delay seconds plus up to 1 second of jitter between calls.
+
+        Args:
+            aws_client: The AwsApiClient for the current Listener
+        """
+        from random import random
+        from time import sleep
+
+        load_balancer_arn = self.get_load_balancer_arn(aws_client)
+        for attempt in range(self.waiter_max_attempts):
+            # Do not reuse a describe_listeners response from before the Listener was created
+            if load_balancer_arn is not None:
+                listeners_batcher.invalidate(load_balancer_arn)
+            listener = self._read(aws_client, force=True)
+            if listener is not None:
+                return listener
+            if attempt < self.waiter_max_attempts - 1:
+                sleep(self.waiter_delay + random())
+        return None
+
+    def _read(self, aws_client: AwsApiClient, force: bool = False) -> Optional[Any]:
         """Returns the Listener
 
         Args:
             aws_client: The AwsApiClient for the current Listener
+            force: Re-fetch the Listener even if it is already available in active_resource
         """
+        # Use the cached listener if available and use_cache = True
+        if self.use_cache and not force and (self.active_resource is not None or self._hydrated):
+            return self.active_resource
+
         logger.debug(f"Reading {self.get_resource_type()}: {self.get_resource_name()}")
 
         from botocore.exceptions import ClientError
 
+        # If the listener was read before, refresh it by ARN
+        listener_arn = self.active_resource.get("ListenerArn", None) if self.active_resource is not None else None
+        self.active_resource = None
+        self._hydrated = False
+
         service_client = self.get_service_client(aws_client)
         try:
-            load_balancer_arn = self.get_load_balancer_arn(aws_client)
-            if load_balancer_arn is None:
-                # logger.error(f"Load balancer ARN not available")
-                return None
-
-            describe_response = service_client.describe_listeners(LoadBalancerArn=load_balancer_arn)
-            logger.debug(f"Describe Response: {describe_response}")
-            resource_list = describe_response.get("Listeners", None)
-
-            if resource_list is not None and isinstance(resource_list, list):
-                # We identify the current listener by the port and protocol
-                current_listener_port = self.get_listener_port()
-                current_listener_protocol = self.get_listener_protocol()
-                for resource in resource_list:
-                    if (
-                        resource.get("Port", None) == current_listener_port
-                        and resource.get("Protocol", None) == current_listener_protocol
-                    ):
-                        logger.debug(f"Found {self.get_resource_type()}: {self.get_resource_name()}")
-                        self.active_resource = resource
-                        break
+            if listener_arn is not None:
+                describe_response = service_client.describe_listeners(ListenerArns=[listener_arn])
+                logger.debug(f"Describe Response: {describe_response}")
+                resource_list = describe_response.get("Listeners", None)
+            else:
+                load_balancer_arn = self.get_load_balancer_arn(aws_client)
+                if load_balancer_arn is None:
+                    # logger.error(f"Load balancer ARN not available")
+                    return None
+
+                # Listeners on the same load balancer share a single describe_listeners call
+                resource_list = listeners_batcher.submit(service_client, load_balancer_arn).result()
+
+            if resource_list:
+                self.active_resource = self.find_listener(resource_list)
         except ClientError as ce:
             logger.debug(f"ClientError: {ce}")
         except Exception as e:
@@ -138,25 +176,75 @@ class Listener(AwsResource):
             logger.error(e)
         return self.active_resource
 
+    def find_listener(self, resource_list: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Returns the current listener from a describe_listeners response"""
+        # We identify the current listener by the port and protocol
+        current_listener_port = self.get_listener_port()
+        current_listener_protocol = self.get_listener_protocol()
+        for resource in resource_list:
+            if (
+                resource.get("Port", None) == current_listener_port
+                and resource.get("Protocol", None) == current_listener_protocol
+            ):
+                logger.debug(f"Found {self.get_resource_type()}: {self.get_resource_name()}")
+                return resource
+        return None
+
+    @classmethod
+    def hydrate_all(cls, aws_client: AwsApiClient, load_balancer_arn: str, listeners: List["Listener"]) -> None:
+        """Reads the listeners on a load balancer with a single describe_listeners call
+
+        Sets active_resource on each Listener, None if it does not exist on the load balancer.
+        Later reads use this result, including for missing Listeners, until the Listener is read with force=True.
+
+        Args:
+            aws_client: The AwsApiClient shared by the Listeners
+            load_balancer_arn: The ARN of the load balancer the Listeners belong to
+            listeners: The Listeners to read
+        """
+        if len(listeners) == 0:
+            return
+
+        from botocore.exceptions import ClientError
+
+        service_client = listeners[0].get_service_client(aws_client)
+        try:
+            resource_list = listeners_batcher.submit(service_client, load_balancer_arn).result()
+        except ClientError as ce:
+            logger.debug(f"ClientError: {ce}")
+            return
+        except Exception as e:
+            logger.error(f"Error reading listeners for {load_balancer_arn}.")
+            logger.error(e)
+            return
+
+        for listener in listeners:
+            listener.active_resource = listener.find_listener(resource_list)
+            listener._hydrated = True
+
     def _delete(self, aws_client: AwsApiClient) -> bool:
         """Deletes the Listener
 
         Args:
             aws_client: The AwsApiClient for the current Listener
         """
-        print_info(f"Deleting {self.get_resource_type()}: {self.get_resource_name()}")
+        logger.info("Deleting %s: %s", self.get_resource_type(), self.get_resource_name())
 
         service_client = self.get_service_client(aws_client)
-        self.active_resource = None
 
         try:
+            # Use the listener arn already read, if available, before clearing active_resource
             listener_arn = self.get_arn(aws_client)
+            self.active_resource = None
             if listener_arn is None:
                 logger.error(f"Listener {self.get_resource_name()} not found.")
                 return True
 
             delete_response = service_client.delete_listener(ListenerArn=listener_arn)
             logger.debug(f"Delete Response: {delete_response}")
+            load_balancer_arn = self.get_load_balancer_arn(aws_client)
+            if load_balancer_arn is not None:
+                listeners_batcher.invalidate(load_balancer_arn)
             return True
         except Exception as e:
             logger.error(f"{self.get_resource_type()} could not be deleted.")
@@ -164,31 +252,32 @@ class Listener(AwsResource):
             logger.error(e)
         return False
 
+    async def _delete_async(self, aws_client: AwsApiClient, executor: Optional[Executor] = None) -> bool:
+        """Deletes the Listener without blocking the event loop
+
+        Args:
+            aws_client: The AwsApiClient for the current Listener
+            executor: The Executor to run the delete on, defaults to the event loop's default executor
+        """
+        from asyncio import get_running_loop
+
+        return await get_running_loop().run_in_executor(executor, self._delete, aws_client)
+
     def _update(self, aws_client: AwsApiClient) -> bool:
-        """Update EcsService"""
-        print_info(f"Updating {self.get_resource_type()}: {self.get_resource_name()}")
+        """Updates the Listener
+
+        Args:
+            aws_client: The AwsApiClient for the current Listener
+        """
+        logger.info("Updating %s: %s", self.get_resource_type(), self.get_resource_name())
 
         listener_arn = self.get_arn(aws_client)
         if listener_arn is None:
             logger.error(f"Listener {self.get_resource_name()} not found.")
             return True
 
-        listener_port = self.get_listener_port()
-        listener_protocol = self.get_listener_protocol()
-        listener_certificates = self.get_listener_certificates(aws_client)
-
         # create a dict of args which are not null, otherwise aws type validation fails
-        not_null_args: Dict[str, Any] = {}
-        if listener_port is not None:
-            not_null_args["Port"] = listener_port
-        if listener_protocol is not None:
-            not_null_args["Protocol"] = listener_protocol
-        if listener_certificates is not None:
-            not_null_args["Certificates"] = listener_certificates
-        if self.ssl_policy is not None:
-            not_null_args["SslPolicy"] = self.ssl_policy
-        if self.alpn_policy is not None:
-            not_null_args["AlpnPolicy"] = self.alpn_policy
+        not_null_args: Dict[str, Any] = self.get_listener_args(aws_client)
 
         if self.default_actions is not None:
             not_null_args["DefaultActions"] = self.default_actions
@@ -204,25 +293,29 @@ class Listener(AwsResource):
 
         service_client = self.get_service_client(aws_client)
         try:
-            create_response = service_client.modify_listener(
+            update_response = service_client.modify_listener(
                 ListenerArn=listener_arn,
                 **not_null_args,
             )
-            logger.debug(f"Update Response: {create_response}")
-            resource_dict = create_response.get("Listeners", {})
-
-            # Validate resource creation
-            if resource_dict is not None:
-                print_info(f"Listener updated: {self.get_resource_name()}")
-                self.active_resource = create_response
+            logger.debug(f"Update Response: {update_response}")
+            resource_list = update_response.get("Listeners", None)
+
+            # Validate resource update
+            if resource_list:
+                load_balancer_arn = self.get_load_balancer_arn(aws_client)
+                if load_balancer_arn is not None:
+                    listeners_batcher.invalidate(load_balancer_arn)
+                self.active_resource = resource_list[0]
                 return True
         except Exception as e:
-            logger.error(f"{self.get_resource_type()} could not be created.")
+            logger.error(f"{self.get_resource_type()} could not be updated.")
             logger.error(e)
         return False
 
-    def get_arn(self, aws_client: AwsApiClient) -> Optional[str]:
-        listener = self._read(aws_client)
+    def get_arn(self, aws_client: AwsApiClient, force_refresh: bool = False) -> Optional[str]:
+        listener = self.active_resource
+        if listener is None or force_refresh:
+            listener = self._read(aws_client, force=force_refresh)
         if listener is None:
             return None
 
@@ -233,6 +326,8 @@ class Listener(AwsResource):
         load_balancer_arn = self.load_balancer_arn
         if load_balancer_arn is None and self.load_balancer:
             load_balancer_arn = self.load_balancer.get_arn(aws_client)
+            # Cache the load balancer arn so it is only resolved once
+            self.load_balancer_arn = load_balancer_arn
 
         return load_balancer_arn
 
@@ -264,6 +359,17 @@ class Listener(AwsResource):
 
         return certificates
 
+    def get_listener_args(self, aws_client: AwsApiClient) -> Dict[str, Any]:
+        """Returns the create_listener/modify_listener args shared by _create and _update which are not null"""
+        listener_args: Dict[str, Any] = {
+            "Port": self.get_listener_port(),
+            "Protocol": self.get_listener_protocol(),
+            "Certificates": self.get_listener_certificates(aws_client),
+            "SslPolicy": self.ssl_policy,
+            "AlpnPolicy": self.alpn_policy,
+        }
+        return {k: v for k, v in listener_args.items() if v is not None}
+
     def get_listener_tags(self):
         tags = self.tags
         if tags is None:
@@ -271,3 +377,24 @@ class Listener(AwsResource):
         tags.append({"Key": "Name", "Value": self.get_resource_name()})
 
         return tags
+
+
+async def delete_listeners_batch(listeners: List[Listener], aws_client: AwsApiClient) -> List[bool]:
+    """Deletes the listeners concurrently, bounded by the size of the service client connection pool
+
+    Public api for callers running their own event loop, e.g. tearing down the listeners of a load balancer
+    from an app or script. The phi cli deletes Listeners using AwsResources and workspace_settings.concurrent_listeners.
+
+    Args:
+        listeners: The Listeners to delete
+        aws_client: The AwsApiClient shared by the Listeners
+    """
+    if len(listeners) == 0:
+        return []
+
+    from asyncio import gather
+    from concurrent.futures import ThreadPoolExecutor
+    from phi.aws.api_client import AWS_MAX_POOL_CONNECTIONS
+
+    with ThreadPoolExecutor(max_workers=min(len(listeners), AWS_MAX_POOL_CONNECTIONS)) as executor:
+        return list(await gather(*(listener._delete_async(aws_client, executor) for listener in listeners)))
@@ -1,4 +1,5 @@
-from typing import Optional, Any, Dict, List, Union
+from threading import Lock
+from typing import Optional, Any, Dict, List, Union, Tuple
 
 from phi.aws.api_client import AwsApiClient
 from phi.aws.resource.base import AwsResource
@@ -6,6 +7,10 @@ from phi.aws.resource.ec2.subnet import Subnet
 from phi.cli.console import print_info
 from phi.utils.log import logger
 
+# TargetGroup ARNs shared by all TargetGroup objects, keyed by (aws_region, aws_profile, name)
+target_group_arns: Dict[Tuple[Optional[str], Optional[str], str], str] = {}
+target_group_arns_lock = Lock()
+
 
 class TargetGroup(AwsResource):
     """
@@ -156,6 +161,8 @@ class TargetGroup(AwsResource):
                 return True
             delete_response = service_client.delete_target_group(TargetGroupArn=tg_arn)
             logger.debug(f"Delete Response: {delete_response}")
+            with target_group_arns_lock:
+                target_group_arns.pop((aws_client.aws_region, aws_client.aws_profile, self.name), None)
             return True
         except Exception as e:
             logger.error(f"{self.get_resource_type()} could not be deleted.")
@@ -213,8 +220,17 @@ class TargetGroup(AwsResource):
         return False
 
     def get_arn(self, aws_client: AwsApiClient) -> Optional[str]:
+        cache_key = (aws_client.aws_region, aws_client.aws_profile, self.name)
+        with target_group_arns_lock:
+            tg_arn = target_group_arns.get(cache_key)
+        if tg_arn is not None:
+            return tg_arn
+
         tg = self._read(aws_client)
         if tg is None:
             return None
         tg_arn = tg.get("TargetGroupArn", None)
+        if tg_arn is not None:
+            with target_group_arns_lock:
+                target_group_arns[cache_key] = tg_arn
         return tg_arn
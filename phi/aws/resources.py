@@ -1,4 +1,4 @@
-from typing import List, Optional, Union, Tuple
+from typing import Dict, Iterator, List, Optional, Union, Tuple
 
 from phi.app.group import AppGroup
 from phi.resource.group import ResourceGroup
@@ -230,22 +230,13 @@ class AwsResources(InfraResources):
                 print_info("-*-")
                 return 0, 0
 
-        for resource in final_aws_resources:
-            print_info(f"\n-==+==- {resource.get_resource_type()}: {resource.get_resource_name()}")
-            if force is True:
-                resource.force = True
-            # logger.debug(resource)
-            try:
-                _resource_created = resource.create(aws_client=self.aws_client)
+        for resource_batch in self.get_resource_batches(final_aws_resources):
+            for _resource_created in self.run_resource_batch(resource_batch, action="create", force=force):
                 if _resource_created:
                     num_resources_created += 1
-                else:
+                elif _resource_created is not None:
                     if self.workspace_settings is not None and not self.workspace_settings.continue_on_create_failure:
                         return num_resources_created, num_resources_to_create
-            except Exception as e:
-                logger.error(f"Failed to create {resource.get_resource_type()}: {resource.get_resource_name()}")
-                logger.error(e)
-                logger.error("Please fix and try again...")
 
         print_heading(f"\n--**-- Resources created: {num_resources_created}/{num_resources_to_create}")
         if num_resources_to_create != num_resources_created:
@@ -411,22 +402,13 @@ class AwsResources(InfraResources):
                 print_info("-*-")
                 return 0, 0
 
-        for resource in final_aws_resources:
-            print_info(f"\n-==+==- {resource.get_resource_type()}: {resource.get_resource_name()}")
-            if force is True:
-                resource.force = True
-            # logger.debug(resource)
-            try:
-                _resource_deleted = resource.delete(aws_client=self.aws_client)
+        for resource_batch in self.get_resource_batches(final_aws_resources):
+            for _resource_deleted in self.run_resource_batch(resource_batch, action="delete", force=force):
                 if _resource_deleted:
                     num_resources_deleted += 1
-                else:
+                elif _resource_deleted is not None:
                     if self.workspace_settings is not None and not self.workspace_settings.continue_on_delete_failure:
                         return num_resources_deleted, num_resources_to_delete
-            except Exception as e:
-                logger.error(f"Failed to delete {resource.get_resource_type()}: {resource.get_resource_name()}")
-                logger.error(e)
-                logger.error("Please fix and try again...")
 
         print_heading(f"\n--**-- Resources deleted: {num_resources_deleted}/{num_resources_to_delete}")
         if num_resources_to_delete != num_resources_deleted:
@@ -584,22 +566,13 @@ class AwsResources(InfraResources):
                 print_info("-*-")
                 return 0, 0
 
-        for resource in final_aws_resources:
-            print_info(f"\n-==+==- {resource.get_resource_type()}: {resource.get_resource_name()}")
-            if force is True:
-                resource.force = True
-            # logger.debug(resource)
-            try:
-                _resource_updated = resource.update(aws_client=self.aws_client)
+        for resource_batch in self.get_resource_batches(final_aws_resources):
+            for _resource_updated in self.run_resource_batch(resource_batch, action="update", force=force):
                 if _resource_updated:
                     num_resources_updated += 1
-                else:
+                elif _resource_updated is not None:
                     if self.workspace_settings is not None and not self.workspace_settings.continue_on_patch_failure:
                         return num_resources_updated, num_resources_to_update
-            except Exception as e:
-                logger.error(f"Failed to update {resource.get_resource_type()}: {resource.get_resource_name()}")
-                logger.error(e)
-                logger.error("Please fix and try again...")
 
         print_heading(f"\n--**-- Resources updated: {num_resources_updated}/{num_resources_to_update}")
         if num_resources_to_update != num_resources_updated:
@@ -608,6 +581,89 @@ class AwsResources(InfraResources):
             )  # noqa: E501
         return num_resources_updated, num_resources_to_update
 
+    def get_resource_batches(self, resources: List[AwsResource]) -> List[List[AwsResource]]:
+        """Splits resources into batches which are run in order.
+
+        Consecutive Listeners are grouped into one batch so they can be read together
+        and, if workspace_settings.concurrent_listeners is True, run concurrently.
+        Every other resource is its own batch.
+        """
+        from phi.aws.resource.elb.listener import Listener
+
+        resource_batches: List[List[AwsResource]] = []
+        for resource in resources:
+            if (
+                isinstance(resource, Listener)
+                and len(resource_batches) > 0
+                and isinstance(resource_batches[-1][0], Listener)
+            ):
+                resource_batches[-1].append(resource)
+            else:
+                resource_batches.append([resource])
+        return resource_batches
+
+    def hydrate_listeners(self, resources: List[AwsResource]) -> None:
+        """Reads the Listeners in resources with one describe_listeners call per load balancer"""
+        from phi.aws.resource.elb.listener import Listener
+
+        listeners_by_load_balancer: Dict[str, List[Listener]] = {}
+        for resource in resources:
+            if isinstance(resource, Listener):
+                load_balancer_arn = resource.get_load_balancer_arn(self.aws_client)
+                if load_balancer_arn is not None:
+                    listeners_by_load_balancer.setdefault(load_balancer_arn, []).append(resource)
+
+        for load_balancer_arn, listeners in listeners_by_load_balancer.items():
+            Listener.hydrate_all(self.aws_client, load_balancer_arn, listeners)
+
+    def run_resource_batch(
+        self, resource_batch: List[AwsResource], action: str, force: Optional[bool] = None
+    ) -> Iterator[Optional[bool]]:
+        """Runs action (create, delete or update) on each resource in the batch.
+
+        Batches of Listeners are read together before running the action. If workspace_settings.concurrent_listeners
+        is True, they are run on a thread pool bounded by the size of the service client connection pool.
+
+        Yields:
+            The result of the action for each resource, None if the action raised an exception.
+        """
+        from phi.cli.console import print_info
+
+        # Create the AwsApiClient before running resources on multiple threads
+        aws_client = self.aws_client
+
+        def run_resource(resource: AwsResource) -> Optional[bool]:
+            print_info(f"\n-==+==- {resource.get_resource_type()}: {resource.get_resource_name()}")
+            if force is True:
+                resource.force = True
+            # logger.debug(resource)
+            try:
+                return getattr(resource, action)(aws_client=aws_client)
+            except Exception as e:
+                logger.error(f"Failed to {action} {resource.get_resource_type()}: {resource.get_resource_name()}")
+                logger.error(e)
+                logger.error("Please fix and try again...")
+            return None
+
+        if len(resource_batch) == 1:
+            yield run_resource(resource_batch[0])
+            return
+
+        self.hydrate_listeners(resource_batch)
+
+        concurrent_listeners = self.workspace_settings is not None and self.workspace_settings.concurrent_listeners
+        if not concurrent_listeners:
+            for resource in resource_batch:
+                yield run_resource(resource)
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+        from phi.aws.api_client import AWS_MAX_POOL_CONNECTIONS
+
+        logger.debug(f"Running {action} for {len(resource_batch)} resources concurrently")
+        with ThreadPoolExecutor(max_workers=min(len(resource_batch), AWS_MAX_POOL_CONNECTIONS)) as executor:
+            yield from executor.map(run_resource, resource_batch)
+
     def save_resources(
         self,
         group_filter: Optional[str] = None,
@@ -152,6 +152,9 @@ class WorkspaceSettings(BaseSettings):
     # Set to True if `phi` should continue patching
     # resources after a resource patch has failed
     continue_on_patch_failure: bool = False
+    # Set to True if `phi` should create, delete and patch
+    # consecutive aws Listeners concurrently
+    concurrent_listeners: bool = False
     #
     # -*- Other Settings
     #